@@ -114,34 +114,39 @@ async def simulate_agent_conversation():
     print(f"   ✓ Added entry #{response['entry_number']} ({response['word_count']} words)")
     print()
     
+    # Run the three independent read variants concurrently - doubles as a
+    # small concurrency stress test of the server's read path
+    full_json, beta_only, last_two = await asyncio.gather(
+        read_memory(ReadMemoryInput(response_format=ResponseFormat.JSON)),
+        read_memory(ReadMemoryInput(
+            response_format=ResponseFormat.MARKDOWN,
+            agent_filter="claude-beta"
+        )),
+        read_memory(ReadMemoryInput(
+            response_format=ResponseFormat.MARKDOWN,
+            limit=2
+        ))
+    )
+
     # Show full conversation in JSON format
     print("\n" + "=" * 70)
     print("Full Conversation (JSON Format)")
     print("=" * 70)
-    result = await read_memory(ReadMemoryInput(response_format=ResponseFormat.JSON))
-    print(result)
+    print(full_json)
     print()
-    
+
     # Test filtering by agent
     print("\n" + "=" * 70)
     print("Testing Agent Filter: Beta's Messages Only")
     print("=" * 70)
-    result = await read_memory(ReadMemoryInput(
-        response_format=ResponseFormat.MARKDOWN,
-        agent_filter="claude-beta"
-    ))
-    print(result)
+    print(beta_only)
     print()
-    
+
     # Test limit parameter
     print("\n" + "=" * 70)
     print("Testing Limit: Last 2 Messages Only")
     print("=" * 70)
-    result = await read_memory(ReadMemoryInput(
-        response_format=ResponseFormat.MARKDOWN,
-        limit=2
-    ))
-    print(result)
+    print(last_two)
     print()
     
     print("=" * 70)
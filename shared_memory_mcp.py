@@ -20,12 +20,19 @@ Usage:
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TypedDict, Union
 from enum import Enum
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timezone, timedelta
+import asyncio
+import functools
 import json
+import mmap
 import os
 from pathlib import Path
+import shutil
+import sys
+import threading
 import uuid
 import re
 import time
@@ -34,11 +41,62 @@ import time
 from utils.file_lock import file_lock, atomic_write, FileLockTimeout, FileLockError
 from utils.logger import get_logger
 
+# Optional orjson acceleration (Rust-backed parser/serializer, roughly 3x
+# faster loads and 6-10x faster dumps than stdlib json). Install with:
+#   pip install mcp-agent-memory[perf]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes buffer, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Tool responses are consumed by programs, so they default to compact
+# JSON (indentation roughly doubles payload size). Set MCP_JSON_INDENT=2
+# to get human-readable responses back when debugging
+JSON_INDENT = int(os.getenv("MCP_JSON_INDENT", "0")) or None
+
+
+def _json_dumps(obj, pretty: bool = JSON_INDENT is not None) -> str:
+    """Serialize an object to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _json_dumps_bytes(obj, pretty: bool = True) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when available.
+
+    Used on the storage write path, where orjson's native bytes output
+    skips the decode/re-encode round trip of `_json_dumps`.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # Constants
 CHARACTER_LIMIT = 25000  # Maximum response size in characters
 MAX_WORDS_PER_ENTRY = 200  # Maximum words per memory entry
+# Character cap rejected before word counting: bounds the work done on
+# pathological inputs without tightening the word-based contract — 200
+# words of long tokens (URLs, base64, CJK text that str.split counts as
+# one word) fit comfortably under 100k characters
+MAX_CONTENT_LENGTH = 100_000
 MAX_ENTRIES = 1000  # Maximum entries before rotation
+MMAP_THRESHOLD = 1_000_000  # Snapshot size above which loads use a memory map
+LOG_COMPACT_BYTES = 256 * 1024  # Append log size that triggers compaction into the snapshot
 MEMORY_FILE = Path.home() / ".shared_memory_mcp" / "memory.json"
+APPEND_LOG_FILE = Path.home() / ".shared_memory_mcp" / "memory.ndjson"
 BACKUP_DIR = Path.home() / ".shared_memory_mcp" / "backups"
 STORAGE_VERSION = "2.0"
 
@@ -73,17 +131,22 @@ class SortOrder(str, Enum):
 
 # Data Models
 
-class MemoryEntry(BaseModel):
-    """Model representing a single memory entry."""
+class MemoryEntry(TypedDict):
+    """Shape of a single stored memory entry.
+
+    Entries are built and passed around as plain dicts on the hot path;
+    this TypedDict documents the schema without pydantic's per-instance
+    validation and memory overhead (tool inputs stay pydantic-validated).
+    """
     entry_id: str
     timestamp: str
     agent_name: str
     content: str
     word_count: int
-    tags: List[str] = Field(default_factory=list)
-    priority: Priority = Priority.MEDIUM
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    updated_at: Optional[str] = None
+    tags: List[str]
+    priority: str
+    metadata: Dict[str, Any]
+    updated_at: Optional[str]
 
 
 class StorageFormat(BaseModel):
@@ -94,24 +157,399 @@ class StorageFormat(BaseModel):
     updated_at: str
 
 
+# Cached tzinfo so hot paths skip repeated attribute lookups
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (hot-path timestamp helper)."""
+    return datetime.now(_UTC).isoformat()
+
+
 # Storage Management Functions
 
+# In-process cache of parsed memory entries. As long as the snapshot file
+# and append log are unchanged, repeat loads return the cached list (two
+# stat syscalls) instead of re-reading and re-parsing the whole store.
+_cache: Optional[List[Dict[str, Any]]] = None
+_cache_key: Optional[tuple] = None
+
+# Guards compound cache updates: loads and saves run on asyncio.to_thread
+# workers, so list/key/index assignment must be atomic as a unit
+_cache_lock = threading.Lock()
+
+# Lazily-built index of agent_name -> entries for the cached list, so
+# agent-filtered reads scan only that agent's entries
+_agent_index: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+# Companion indexes over the cached list: entry_id -> entry gives O(1)
+# lookups for update/delete, and tag -> cache positions lets tag-filtered
+# reads intersect small sets instead of rescanning every entry
+_id_index: Optional[Dict[str, Dict[str, Any]]] = None
+_tag_index: Optional[Dict[str, set]] = None
+
+# Trigram -> cache positions over content/agent/tags, so searches narrow
+# to candidate entries by set intersection before the substring verify
+_trigram_index: Optional[Dict[str, set]] = None
+
+# created_at from the last snapshot read/write, so saves don't re-read
+# and re-parse the whole file just to preserve one timestamp
+_created_at: Optional[str] = None
+
+# Aggregate statistics for the cached entries, keyed like the entry cache
+# so repeat get_memory_stats calls skip the full scan
+_stats_cache: Optional[Dict[str, Any]] = None
+_stats_key: Optional[tuple] = None
+
+
+def _storage_key() -> Optional[tuple]:
+    """Return a cache key identifying the current on-disk storage state."""
+    try:
+        snapshot_stat = MEMORY_FILE.stat()
+        snapshot_key = (snapshot_stat.st_mtime_ns, snapshot_stat.st_size)
+        if APPEND_LOG_FILE.exists():
+            log_stat = APPEND_LOG_FILE.stat()
+            return snapshot_key + (log_stat.st_mtime_ns, log_stat.st_size)
+        return snapshot_key + (0, 0)
+    except OSError:
+        return None
+
+
+def _update_cache(
+    memories: Optional[List[Dict[str, Any]]],
+    appended: Optional[Dict[str, Any]] = None,
+    storage_key: Optional[tuple] = None
+) -> None:
+    """
+    Update (or invalidate, with None) the in-process memory cache.
+
+    When a single entry was appended, pass it as `appended` (not yet in
+    `memories`): the list append happens here under the cache lock, so
+    the entry's position in the tag/trigram indexes cannot be attributed
+    to a concurrent append. Pass `storage_key` when the caller stat'ed
+    storage while still holding the append-log lock, so the key cannot
+    cover another process's interleaved write.
+    """
+    global _cache, _cache_key, _agent_index, _id_index, _tag_index, _trigram_index
+
+    with _cache_lock:
+        if memories is not None and appended is not None:
+            memories.append(appended)
+
+        _cache = memories
+        if memories is None:
+            _cache_key = None
+        else:
+            _cache_key = storage_key if storage_key is not None else _storage_key()
+        if _cache_key is None:
+            _cache = None
+
+        if _cache is not None and appended is not None:
+            if _agent_index is not None:
+                _agent_index[appended.get("agent_name", "unknown")].append(appended)
+            if _id_index is not None:
+                _id_index[appended.get("entry_id", "")] = appended
+            position = len(_cache) - 1
+            if _tag_index is not None:
+                for tag in appended.get("tags", []):
+                    _tag_index.setdefault(tag, set()).add(position)
+            if _trigram_index is not None:
+                for trigram in _entry_trigrams(appended):
+                    _trigram_index.setdefault(trigram, set()).add(position)
+        else:
+            _agent_index = None
+            _id_index = None
+            _tag_index = None
+            _trigram_index = None
+
+
+def _get_agent_index() -> Dict[str, List[Dict[str, Any]]]:
+    """Build (lazily) and return the agent index for the cached entries."""
+    global _agent_index
+
+    if _agent_index is None:
+        index = defaultdict(list)
+        for entry in load_memories():
+            index[entry.get("agent_name", "unknown")].append(entry)
+        _agent_index = index
+
+    return _agent_index
+
+
+def _get_id_index() -> Dict[str, Dict[str, Any]]:
+    """Build (lazily) and return the entry_id index for the cached entries."""
+    global _id_index
+
+    if _id_index is None:
+        _id_index = {entry.get("entry_id", ""): entry for entry in load_memories()}
+
+    return _id_index
+
+
+def _tag_filtered_entries(
+    memories: List[Dict[str, Any]], required_tags: List[str]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Resolve a tag filter through the position index, atomically.
+
+    The identity check, lazy index build, and position lookup all happen
+    under the cache lock, so a concurrent invalidate-and-rebuild cannot
+    apply one list's positions to another. Returns None when `memories`
+    is not the live cache; the caller falls back to the full scan.
+    """
+    global _tag_index
+
+    with _cache_lock:
+        if memories is not _cache:
+            return None
+
+        if _tag_index is None:
+            index: Dict[str, set] = {}
+            for position, entry in enumerate(memories):
+                for tag in entry.get("tags", []):
+                    index.setdefault(tag, set()).add(position)
+            _tag_index = index
+
+        positions = _tag_index.get(required_tags[0], set())
+        for tag in required_tags[1:]:
+            positions = positions & _tag_index.get(tag, set())
+            if not positions:
+                break
+
+        return [memories[i] for i in sorted(positions)]
+
+
+def _text_trigrams(text: str) -> set:
+    """Return the set of lowercased character trigrams in a string."""
+    lowered = text.lower()
+    return {lowered[i:i + 3] for i in range(len(lowered) - 2)}
+
+
+def _entry_trigrams(entry: Dict[str, Any]) -> set:
+    """Return the trigrams of an entry's searchable fields."""
+    trigrams = _text_trigrams(entry.get("content", ""))
+    trigrams |= _text_trigrams(entry.get("agent_name", ""))
+    for tag in entry.get("tags", []):
+        trigrams |= _text_trigrams(tag)
+    return trigrams
+
+
+def _trigram_candidates(
+    memories: List[Dict[str, Any]], query: str
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Narrow a search to candidate entries via the trigram index, atomically.
+
+    Like _tag_filtered_entries, everything from the identity check to the
+    position lookup runs under the cache lock. Returns None when
+    `memories` is not the live cache (caller scans the full list); an
+    empty list means no entry can match the query.
+    """
+    global _trigram_index
+
+    with _cache_lock:
+        if memories is not _cache:
+            return None
+
+        if _trigram_index is None:
+            index: Dict[str, set] = {}
+            for position, entry in enumerate(memories):
+                for trigram in _entry_trigrams(entry):
+                    index.setdefault(trigram, set()).add(position)
+            _trigram_index = index
+
+        positions: Optional[set] = None
+        for trigram in _text_trigrams(query):
+            posting = _trigram_index.get(trigram)
+            if not posting:
+                return []
+            positions = posting.copy() if positions is None else positions & posting
+            if not positions:
+                return []
+
+        return [memories[i] for i in sorted(positions)]
+
+
+def _compute_aggregates(memories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Scan the entries once and compute the statistics aggregates.
+
+    Word total, agent activity, tag usage, priority distribution and the
+    date range are all accumulated in a single pass so each entry dict is
+    touched exactly once.
+    """
+    total_words = 0
+    agent_counts: Counter = Counter()
+    tag_counts: Counter = Counter()
+    priority_counts = Counter({"low": 0, "medium": 0, "high": 0})
+    earliest: Optional[str] = None
+    latest: Optional[str] = None
+
+    for m in memories:
+        total_words += m.get("word_count", 0)
+
+        agent_counts[m.get("agent_name", "unknown")] += 1
+        tag_counts.update(m.get("tags", ()))
+        priority_counts[m.get("priority", "medium")] += 1
+
+        timestamp = m.get("timestamp")
+        if timestamp:
+            if earliest is None or timestamp < earliest:
+                earliest = timestamp
+            if latest is None or timestamp > latest:
+                latest = timestamp
+
+    return {
+        "total_entries": len(memories),
+        "total_words": total_words,
+        "agent_counts": agent_counts,
+        "tag_counts": tag_counts,
+        "priority_counts": priority_counts,
+        "date_range": {
+            "earliest": earliest,
+            "latest": latest
+        }
+    }
+
+
+def _get_aggregates(memories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return statistics aggregates for the entries, cached by storage state.
+
+    For the cached store the full scan runs once per storage state; any
+    write changes the key and invalidates the cached aggregates. Ad-hoc
+    lists are always computed fresh.
+    """
+    global _stats_cache, _stats_key
+
+    if memories is _cache:
+        if _stats_cache is not None and _stats_key == _cache_key:
+            return _stats_cache
+        aggregates = _compute_aggregates(memories)
+        _stats_cache = aggregates
+        _stats_key = _cache_key
+        return aggregates
+
+    return _compute_aggregates(memories)
+
+
+def _memoize_response(handler):
+    """
+    Cache a read-only tool's fully-rendered response string.
+
+    Keyed on the validated params (frozen, hence hashable, pydantic
+    models) plus the storage state, so any write naturally invalidates
+    stale responses. On a hit the handler body — load, filter, serialize
+    — is skipped entirely and the cached string is returned as-is.
+    """
+    cache: Dict[tuple, str] = {}
+
+    @functools.wraps(handler)
+    async def wrapper(params) -> str:
+        storage_key = _storage_key()
+        if storage_key is None:
+            return await handler(params)
+
+        key = (params, storage_key)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await handler(params)
+        if len(cache) >= 256:
+            # Drop the oldest entry; almost everything here is stale
+            # renders of earlier storage states anyway
+            cache.pop(next(iter(cache)))
+        cache[key] = result
+        return result
+
+    return wrapper
+
+
 def ensure_storage_structure() -> None:
     """Ensure storage directory, file, and backup directory exist."""
     MEMORY_FILE.parent.mkdir(parents=True, exist_ok=True)
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
     if not MEMORY_FILE.exists():
+        global _created_at
         initial_storage = {
             "version": STORAGE_VERSION,
             "entries": [],
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": _now_iso(),
+            "updated_at": _now_iso()
         }
-        atomic_write(MEMORY_FILE, json.dumps(initial_storage, indent=2))
+        atomic_write(MEMORY_FILE, _json_dumps_bytes(initial_storage, pretty=False))
+        _created_at = initial_storage["created_at"]
         logger.info("Initialized new memory storage", version=STORAGE_VERSION)
 
 
+def _parse_snapshot(content) -> List[Dict[str, Any]]:
+    """
+    Parse snapshot file contents into a list of entries.
+
+    Accepts a str or any bytes-like buffer (including a memory map) that
+    the JSON parser can consume directly. Handles v1 (list) and v2 (dict)
+    formats and falls back to backup recovery on corruption.
+
+    Args:
+        content: Raw snapshot contents
+
+    Returns:
+        List[Dict[str, Any]]: Parsed memory entries
+    """
+    if not content or (isinstance(content, str) and not content.strip()):
+        logger.warning("Empty memory file detected, initializing")
+        return []
+
+    try:
+        data = _json_loads(content)
+
+        # Handle v1 format (list) vs v2 format (dict with version)
+        if isinstance(data, list):
+            logger.info("Detected v1 format, auto-migrating to v2")
+            return data
+        if isinstance(data, dict):
+            global _created_at
+            _created_at = data.get("created_at") or _created_at
+            return data.get("entries", [])
+
+        logger.error("Invalid storage format detected", type=type(data).__name__)
+        return []
+
+    except ValueError as e:
+        logger.log_storage_corruption(str(MEMORY_FILE), str(e))
+        # Try to recover from backup
+        backup_entries = recover_from_backup()
+        if backup_entries is not None:
+            logger.log_storage_recovered(str(MEMORY_FILE), backup_used=True)
+            return backup_entries
+
+        logger.error("Unable to recover from backup, returning empty", exc_info=True)
+        return []
+
+
+def _intern_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern an entry's highly-repetitive string fields, in place.
+
+    agent_name, priority and tags repeat across the store; sys.intern
+    collapses each distinct value to a single shared object, so the
+    cached list holds one copy per value and downstream equality and set
+    membership checks hit the pointer-identity fast path.
+    """
+    agent = entry.get("agent_name")
+    if type(agent) is str:
+        entry["agent_name"] = sys.intern(agent)
+    priority = entry.get("priority")
+    if type(priority) is str:
+        entry["priority"] = sys.intern(priority)
+    tags = entry.get("tags")
+    if tags:
+        entry["tags"] = [sys.intern(t) if type(t) is str else t for t in tags]
+    return entry
+
+
 def load_memories() -> List[Dict[str, Any]]:
     """
     Load all memory entries from the JSON file with file locking.
@@ -124,40 +562,48 @@ def load_memories() -> List[Dict[str, Any]]:
     """
     ensure_storage_structure()
 
+    # Serve from cache when the storage hasn't changed since the last parse
+    # (the lock keeps the list/key pair consistent across worker threads).
+    # The key is captured BEFORE reading: an append landing mid-read can
+    # then only make the published key stale (a safe miss on the next
+    # lookup), never claim to cover records the parsed list lacks
+    storage_key = _storage_key()
+    with _cache_lock:
+        if _cache is not None and storage_key == _cache_key:
+            return _cache
+
+    # Empty-store fast path: nothing to lock or parse
+    # (key layout: snapshot mtime/size, log mtime/size)
+    if storage_key is not None and storage_key[1] == 0 and storage_key[3] == 0:
+        entries: List[Dict[str, Any]] = []
+        _update_cache(entries, storage_key=storage_key)
+        return entries
+
     try:
         start_time = time.time()
-        with file_lock(MEMORY_FILE, timeout=10.0) as f:
+        # Shared lock: concurrent readers proceed in parallel, only
+        # writers serialize
+        with file_lock(MEMORY_FILE, timeout=10.0, shared=True) as f:
             lock_time = (time.time() - start_time) * 1000
             logger.log_lock_acquired(str(MEMORY_FILE), lock_time)
 
-            content = f.read()
+            if orjson is not None and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                # Large snapshot: hand orjson a memory-mapped buffer so the
+                # kernel pages the file in on demand instead of read()
+                # copying it all into a Python string first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    entries = _parse_snapshot(memoryview(mm))
+            else:
+                entries = _parse_snapshot(f.read())
 
-            if not content.strip():
-                logger.warning("Empty memory file detected, initializing")
-                return []
+            # Replay records appended to the NDJSON log since last compaction
+            _replay_append_log(entries)
 
-            try:
-                data = json.loads(content)
+            for entry in entries:
+                _intern_entry(entry)
 
-                # Handle v1 format (list) vs v2 format (dict with version)
-                if isinstance(data, list):
-                    logger.info("Detected v1 format, auto-migrating to v2")
-                    return data
-                elif isinstance(data, dict):
-                    return data.get("entries", [])
-                else:
-                    logger.error("Invalid storage format detected", type=type(data).__name__)
-                    return []
-
-            except json.JSONDecodeError as e:
-                logger.log_storage_corruption(str(MEMORY_FILE), str(e))
-                # Try to recover from backup
-                backup_entries = recover_from_backup()
-                if backup_entries is not None:
-                    logger.log_storage_recovered(str(MEMORY_FILE), backup_used=True)
-                    return backup_entries
-                logger.error("Unable to recover from backup, returning empty", exc_info=True)
-                return []
+            _update_cache(entries, storage_key=storage_key)
+            return entries
 
     except FileLockTimeout as e:
         logger.log_lock_timeout(str(MEMORY_FILE), 10.0)
@@ -167,63 +613,321 @@ def load_memories() -> List[Dict[str, Any]]:
         return []
 
 
-def save_memories(memories: List[Dict[str, Any]]) -> None:
+_CREATED_AT_RE = re.compile(r'"created_at"\s*:\s*"([^"]+)"')
+
+
+def _extract_created_at(f) -> Optional[str]:
+    """
+    Pull the top-level created_at value from an open snapshot handle.
+
+    The field is serialized after the entries list, so it sits in the
+    file's final bytes: a regex over the tail finds it without parsing
+    the whole store. Falls back to a full parse if the tail misses
+    (e.g. a mid-character seek in multibyte content).
+    """
+    try:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 2048))
+        matches = _CREATED_AT_RE.findall(f.read())
+        if matches:
+            return matches[-1]
+    except (OSError, ValueError, UnicodeDecodeError):
+        pass
+
+    f.seek(0)
+    content = f.read()
+    if content.strip():
+        data = _json_loads(content)
+        if isinstance(data, dict):
+            return data.get("created_at")
+    return None
+
+
+def save_memories(memories: List[Dict[str, Any]], fold_log: bool = True) -> None:
     """
     Save memory entries to the JSON file with file locking and rotation.
 
+    The append-log lock is held from before the snapshot write until the
+    log is reset, so an append that another writer already fdatasync'd
+    cannot land in the window between the two and be destroyed.
+
     Args:
         memories (List[Dict[str, Any]]): List of memory entries to save
+        fold_log (bool): Replay the append log onto `memories` under the
+            lock before truncating it, picking up records that landed
+            after the caller built its list (replay is idempotent for
+            records the list already contains). clear_memory passes
+            False: a wipe discards the log by design
     """
     ensure_storage_structure()
 
     try:
-        # Apply rotation if needed
-        if len(memories) > MAX_ENTRIES:
-            rotated_count = len(memories) - MAX_ENTRIES
-            logger.warning(
-                f"Rotating memory: removing {rotated_count} oldest entries",
-                total_entries=len(memories),
-                max_entries=MAX_ENTRIES
-            )
-            memories = memories[-MAX_ENTRIES:]
+        with file_lock(APPEND_LOG_FILE, timeout=10.0):
+            if fold_log:
+                _replay_append_log(memories)
+
+            # Apply rotation if needed
+            if len(memories) > MAX_ENTRIES:
+                rotated_count = len(memories) - MAX_ENTRIES
+                logger.warning(
+                    f"Rotating memory: removing {rotated_count} oldest entries",
+                    total_entries=len(memories),
+                    max_entries=MAX_ENTRIES
+                )
+                memories = memories[-MAX_ENTRIES:]
+
+            # Create storage structure
+            storage_data = {
+                "version": STORAGE_VERSION,
+                "entries": memories,
+                "created_at": None,  # Will preserve from cache or existing file
+                "updated_at": _now_iso()
+            }
 
-        # Create storage structure
-        storage_data = {
-            "version": STORAGE_VERSION,
-            "entries": memories,
-            "created_at": None,  # Will preserve from existing file
-            "updated_at": datetime.now(timezone.utc).isoformat()
-        }
+            # Preserve created_at: the cached value covers every save after
+            # the first load; cold-start saves pull the field straight from
+            # the file tail with a regex instead of parsing the whole store
+            global _created_at
+            if _created_at is None:
+                try:
+                    with file_lock(MEMORY_FILE, timeout=10.0) as f:
+                        _created_at = _extract_created_at(f)
+                except Exception:
+                    pass
 
-        # Preserve created_at timestamp
-        try:
-            with file_lock(MEMORY_FILE, timeout=10.0) as f:
-                content = f.read()
-                if content.strip():
-                    existing_data = json.loads(content)
-                    if isinstance(existing_data, dict) and "created_at" in existing_data:
-                        storage_data["created_at"] = existing_data["created_at"]
-        except Exception:
-            pass
+            if _created_at is None:
+                _created_at = _now_iso()
+
+            storage_data["created_at"] = _created_at
+
+            # Create backup before writing
+            create_backup()
 
-        # Set created_at if not set
-        if storage_data["created_at"] is None:
-            storage_data["created_at"] = datetime.now(timezone.utc).isoformat()
+            # Write with atomic operation; the snapshot is machine-read only,
+            # so compact serialization halves its size and parse cost
+            atomic_write(MEMORY_FILE, _json_dumps_bytes(storage_data, pretty=False))
 
-        # Create backup before writing
-        create_backup()
+            # The snapshot now contains everything folded in above:
+            # reset the append log while the lock is still held
+            if APPEND_LOG_FILE.exists():
+                atomic_write(APPEND_LOG_FILE, "")
 
-        # Write with atomic operation
-        atomic_write(MEMORY_FILE, json.dumps(storage_data, indent=2))
+            # Keep the in-process cache in sync with what was just written
+            _update_cache(memories)
 
         logger.debug("Memories saved successfully", entry_count=len(memories))
 
     except FileLockTimeout as e:
         logger.log_lock_timeout(str(MEMORY_FILE), 10.0)
+        _update_cache(None)
         raise
     except Exception as e:
         logger.error(f"Failed to save memories", exc_info=True)
+        _update_cache(None)
+        raise
+
+
+def _replay_append_log(entries: List[Dict[str, Any]]) -> None:
+    """
+    Replay the NDJSON append log on top of the snapshot entries, in place.
+
+    The log carries two kinds of records: plain entry dicts (adds) and
+    op-tagged deltas ({"op": "update"|"delete", "entry_id": ..., ...})
+    written by update/delete instead of a full-store rewrite. Each line
+    is an independent JSON document, so a corrupt line only loses that
+    record instead of the whole log.
+
+    Args:
+        entries (List[Dict[str, Any]]): Snapshot entries to replay onto
+    """
+    if not APPEND_LOG_FILE.exists() or APPEND_LOG_FILE.stat().st_size == 0:
+        return
+
+    by_id = {entry.get("entry_id"): entry for entry in entries}
+
+    with open(APPEND_LOG_FILE, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _json_loads(line)
+            except ValueError as e:
+                logger.warning("Skipping corrupt append log line", error=str(e))
+                continue
+
+            op = record.get("op")
+            if op is None:
+                entry_id = record.get("entry_id")
+                # A crash between the snapshot write and the log reset in
+                # save_memories leaves an add in both files; the snapshot
+                # copy is newer (it has later deltas folded in), so skip
+                if entry_id in by_id:
+                    continue
+                entries.append(record)
+                by_id[entry_id] = record
+            elif op == "update":
+                target = by_id.get(record.get("entry_id"))
+                if target is not None:
+                    target.update(record.get("fields", {}))
+            elif op == "delete":
+                target = by_id.pop(record.get("entry_id"), None)
+                if target is not None:
+                    for position, entry in enumerate(entries):
+                        if entry is target:
+                            del entries[position]
+                            break
+            else:
+                logger.warning("Skipping unknown append log op", op=op)
+
+
+def append_entry(entry: Dict[str, Any]) -> int:
+    """
+    Append a single entry to the NDJSON log.
+
+    This is the hot path for add_memory: one O(entry size) write instead
+    of re-serializing the entire store. The log is folded back into the
+    snapshot whenever save_memories runs.
+
+    Args:
+        entry (Dict[str, Any]): The memory entry to append
+
+    Returns:
+        int: Total number of entries after the append
+
+    Raises:
+        FileLockTimeout: If unable to acquire lock within timeout
+    """
+    _intern_entry(entry)
+
+    try:
+        with file_lock(APPEND_LOG_FILE, timeout=10.0):
+            # Load under the log lock: no other appender (thread or
+            # process) can interleave between this read and the key stat
+            # below, so the list and the key describe the same state
+            memories = load_memories()
+
+            with open(APPEND_LOG_FILE, 'ab') as f:
+                f.write(_json_dumps_bytes(entry, pretty=False) + b'\n')
+                f.flush()
+                # fdatasync: data durability without the inode-metadata
+                # journal flush (falls back to fsync off Linux)
+                getattr(os, 'fdatasync', os.fsync)(f.fileno())
+
+            # Stat while the lock is still held, so the key cannot cover
+            # another process's append that the cached list lacks
+            storage_key = _storage_key()
+
+            # Keep the in-process cache in sync with the appended entry
+            # (_update_cache performs the list append under the cache lock)
+            _update_cache(memories, appended=entry, storage_key=storage_key)
+
+        logger.debug("Entry appended to log", entry_id=entry.get("entry_id"))
+
+        # Compact (and rotate) once the store exceeds MAX_ENTRIES
+        if len(memories) > MAX_ENTRIES:
+            save_memories(memories)
+            return MAX_ENTRIES
+
+        # Also fold the log into the snapshot before it grows unbounded,
+        # keeping cold-start replay cost small
+        try:
+            if APPEND_LOG_FILE.stat().st_size > LOG_COMPACT_BYTES:
+                save_memories(memories)
+        except OSError:
+            pass
+
+        return len(memories)
+
+    except FileLockTimeout:
+        logger.log_lock_timeout(str(APPEND_LOG_FILE), 10.0)
         raise
+    except Exception:
+        logger.error("Failed to append entry to log", exc_info=True)
+        raise
+
+
+def append_delta(record: Dict[str, Any], memories: List[Dict[str, Any]]) -> None:
+    """
+    Append an op-tagged update/delete record to the NDJSON log.
+
+    The caller has already applied the change to `memories` (the cached
+    list); this persists it as one O(record size) line instead of
+    rewriting the whole store. _replay_append_log folds the delta back
+    in on the next cold load.
+
+    Args:
+        record (Dict[str, Any]): The op-tagged delta record
+        memories (List[Dict[str, Any]]): Entries with the change applied
+
+    Raises:
+        FileLockTimeout: If unable to acquire lock within timeout
+    """
+    try:
+        with file_lock(APPEND_LOG_FILE, timeout=10.0):
+            # The caller loaded and mutated `memories` before taking the
+            # lock; if storage moved underneath it in the meantime, the
+            # list cannot be re-published under the post-write key
+            with _cache_lock:
+                fresh = memories is _cache and _storage_key() == _cache_key
+
+            with open(APPEND_LOG_FILE, 'ab') as f:
+                f.write(_json_dumps_bytes(record, pretty=False) + b'\n')
+                f.flush()
+                getattr(os, 'fdatasync', os.fsync)(f.fileno())
+
+            # Stat under the lock for the same reason as append_entry
+            storage_key = _storage_key()
+
+            if fresh:
+                # Re-key the cache against the grown log
+                _update_cache(memories, storage_key=storage_key)
+            else:
+                # The delta is safely in the log; let the next read
+                # rebuild from disk and fold it in via replay
+                _update_cache(None)
+
+        logger.debug(
+            "Delta appended to log",
+            op=record.get("op"),
+            entry_id=record.get("entry_id")
+        )
+
+        # Same compaction policy as plain appends
+        try:
+            if APPEND_LOG_FILE.stat().st_size > LOG_COMPACT_BYTES:
+                save_memories(memories)
+        except OSError:
+            pass
+
+    except FileLockTimeout:
+        logger.log_lock_timeout(str(APPEND_LOG_FILE), 10.0)
+        # The caller already mutated the cached list; drop the cache so
+        # the unpersisted change is not served as current
+        _update_cache(None)
+        raise
+    except Exception:
+        logger.error("Failed to append delta to log", exc_info=True)
+        _update_cache(None)
+        raise
+
+
+async def _load_memories_async() -> List[Dict[str, Any]]:
+    """
+    Load memories in a worker thread.
+
+    The blocking lock/read/parse work runs via asyncio.to_thread so the
+    event loop can service other tool calls concurrently.
+    """
+    return await asyncio.to_thread(load_memories)
+
+
+async def _save_memories_async(
+    memories: List[Dict[str, Any]], fold_log: bool = True
+) -> None:
+    """Save memories in a worker thread, keeping the event loop unblocked."""
+    await asyncio.to_thread(save_memories, memories, fold_log)
 
 
 def create_backup() -> None:
@@ -232,15 +936,17 @@ def create_backup() -> None:
         return
 
     try:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
         backup_file = BACKUP_DIR / f"memory_backup_{timestamp}.json"
 
-        # Copy current file to backup
-        with open(MEMORY_FILE, 'r') as src:
-            content = src.read()
-
-        with open(backup_file, 'w') as dst:
-            dst.write(content)
+        # Snapshot the current file without routing its bytes through
+        # Python: atomic_write replaces the inode on every save, so a
+        # hardlink safely pins the pre-save content. Fall back to
+        # copyfile (an in-kernel copy on Linux) across filesystems.
+        try:
+            os.link(MEMORY_FILE, backup_file)
+        except OSError:
+            shutil.copyfile(MEMORY_FILE, backup_file)
 
         logger.debug("Backup created", backup_file=str(backup_file))
 
@@ -251,15 +957,33 @@ def create_backup() -> None:
         logger.warning(f"Failed to create backup", error=str(e))
 
 
+def _list_backups() -> List[os.DirEntry]:
+    """
+    List backup files oldest-first, sorted by modification time.
+
+    os.scandir returns name and stat in one pass per file, avoiding the
+    Path construction and extra stat calls of Path.glob; sorting by mtime
+    is also more robust than relying on the timestamp embedded in the
+    filename sorting lexicographically.
+    """
+    return sorted(
+        (
+            e for e in os.scandir(BACKUP_DIR)
+            if e.name.startswith("memory_backup_") and e.name.endswith(".json")
+        ),
+        key=lambda e: e.stat().st_mtime_ns
+    )
+
+
 def cleanup_old_backups(keep: int = 10) -> None:
     """Remove old backup files, keeping only the most recent ones."""
     try:
-        backups = sorted(BACKUP_DIR.glob("memory_backup_*.json"))
+        backups = _list_backups()
 
         if len(backups) > keep:
             for backup_file in backups[:-keep]:
-                backup_file.unlink()
-                logger.debug("Removed old backup", file=str(backup_file))
+                os.unlink(backup_file.path)
+                logger.debug("Removed old backup", file=backup_file.path)
 
     except Exception as e:
         logger.warning(f"Failed to cleanup old backups", error=str(e))
@@ -273,7 +997,7 @@ def recover_from_backup() -> Optional[List[Dict[str, Any]]]:
         Optional[List[Dict[str, Any]]]: Recovered entries or None if recovery fails
     """
     try:
-        backups = sorted(BACKUP_DIR.glob("memory_backup_*.json"))
+        backups = _list_backups()
 
         if not backups:
             logger.warning("No backup files found for recovery")
@@ -282,18 +1006,18 @@ def recover_from_backup() -> Optional[List[Dict[str, Any]]]:
         # Try most recent backup first
         for backup_file in reversed(backups):
             try:
-                with open(backup_file, 'r') as f:
-                    data = json.load(f)
+                with open(backup_file.path, 'rb') as f:
+                    data = _json_loads(f.read())
 
                 if isinstance(data, list):
-                    logger.info(f"Recovered from backup (v1)", backup=str(backup_file))
+                    logger.info(f"Recovered from backup (v1)", backup=backup_file.path)
                     return data
                 elif isinstance(data, dict) and "entries" in data:
-                    logger.info(f"Recovered from backup (v2)", backup=str(backup_file))
+                    logger.info(f"Recovered from backup (v2)", backup=backup_file.path)
                     return data["entries"]
 
             except Exception as e:
-                logger.warning(f"Failed to recover from backup", backup=str(backup_file), error=str(e))
+                logger.warning(f"Failed to recover from backup", backup=backup_file.path, error=str(e))
                 continue
 
         logger.error("All backup recovery attempts failed")
@@ -306,27 +1030,56 @@ def recover_from_backup() -> Optional[List[Dict[str, Any]]]:
 
 # Utility Functions
 
+_WORD_RE = re.compile(r"\S+")
+
+
 def count_words(text: str) -> int:
-    """Count the number of words in a text string."""
-    return len(text.split())
+    """
+    Count the number of words in a text string.
+
+    Scans with a precompiled regex instead of str.split, so no list of
+    substring objects is allocated per call. Counting short-circuits once
+    the total passes MAX_WORDS_PER_ENTRY: counts are only ever compared
+    against that limit, so an oversized payload is rejected after ~200
+    tokens instead of tokenizing megabytes of input.
+
+    Empty or whitespace-only text counts as one word, matching the
+    historical str.split-based behaviour the tests pin down.
+    """
+    count = 0
+    for count, _ in enumerate(_WORD_RE.finditer(text), 1):
+        if count > MAX_WORDS_PER_ENTRY:
+            break
+    return max(1, count)
+
+
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+    r"[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
 
 
 def generate_entry_id() -> str:
-    """Generate a unique entry ID."""
-    return str(uuid.uuid4())
+    """Generate a unique entry ID (dashed UUID format)."""
+    raw = uuid.uuid4().hex
+    return f"{raw[:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:]}"
 
 
 def validate_entry_id(entry_id: str) -> bool:
-    """Validate that a string is a valid UUID."""
-    try:
-        uuid.UUID(entry_id)
-        return True
-    except ValueError:
-        return False
+    """Validate that a string is a dashed-format UUID."""
+    return _UUID_RE.match(entry_id) is not None
 
 
 def find_entry_by_id(memories: List[Dict[str, Any]], entry_id: str) -> Optional[Dict[str, Any]]:
-    """Find a memory entry by its ID."""
+    """
+    Find a memory entry by its ID.
+
+    When given the cached store this is an O(1) index lookup; arbitrary
+    lists fall back to a linear scan.
+    """
+    if memories is _cache:
+        return _get_id_index().get(entry_id)
+
     for entry in memories:
         if entry.get("entry_id") == entry_id:
             return entry
@@ -335,7 +1088,7 @@ def find_entry_by_id(memories: List[Dict[str, Any]], entry_id: str) -> Optional[
 
 def filter_memories(
     memories: List[Dict[str, Any]],
-    agent_filter: Optional[str] = None,
+    agent_filter: Optional[Union[str, List[str]]] = None,
     tags: Optional[List[str]] = None,
     priority: Optional[Priority] = None,
     date_from: Optional[str] = None,
@@ -346,7 +1099,8 @@ def filter_memories(
 
     Args:
         memories: List of memory entries
-        agent_filter: Filter by agent name
+        agent_filter: Filter by agent name (a single name or a collection
+            of names; entries by any of them match)
         tags: Filter by tags (must have all specified tags)
         priority: Filter by priority level
         date_from: Filter entries after this ISO timestamp
@@ -357,29 +1111,56 @@ def filter_memories(
     """
     filtered = memories
 
-    # Agent filter
+    # Normalize the predicates once, outside any loop
+    agents = None
     if agent_filter:
-        filtered = [m for m in filtered if m.get("agent_name") == agent_filter]
-
-    # Tags filter (entry must have all specified tags)
-    if tags:
-        filtered = [
-            m for m in filtered
-            if all(tag in m.get("tags", []) for tag in tags)
-        ]
-
-    # Priority filter
-    if priority:
-        filtered = [m for m in filtered if m.get("priority") == priority.value]
-
-    # Date range filters
-    if date_from:
-        filtered = [m for m in filtered if m.get("timestamp", "") >= date_from]
-
-    if date_to:
-        filtered = [m for m in filtered if m.get("timestamp", "") <= date_to]
-
-    return filtered
+        agents = frozenset((agent_filter,)) if isinstance(agent_filter, str) else frozenset(agent_filter)
+    prio_val = priority.value if priority else None
+    required_tags = tags or None
+
+    # Tags filter on the cached store: intersect the per-tag position
+    # sets instead of scanning, then drop the predicate — it's satisfied
+    if required_tags:
+        by_tags = _tag_filtered_entries(filtered, required_tags)
+        if by_tags is not None:
+            filtered = by_tags
+            required_tags = None
+
+    if (
+        agents is None and required_tags is None and prio_val is None
+        and not date_from and not date_to
+    ):
+        return filtered
+
+    # One fused pass: every remaining predicate is tested per entry in a
+    # single comprehension instead of one list rebuild per criterion,
+    # cheapest rejects first (set/string compares before the tag subset
+    # scan). Timestamps are ISO-8601, so the date range is a plain string
+    # compare
+    return [
+        m for m in filtered
+        if (agents is None or m.get("agent_name") in agents)
+        and (prio_val is None or m.get("priority") == prio_val)
+        and (not date_from or m.get("timestamp", "") >= date_from)
+        and (not date_to or m.get("timestamp", "") <= date_to)
+        and (required_tags is None or all(tag in m.get("tags", []) for tag in required_tags))
+    ]
+
+
+def _entry_matches(
+    entry: Dict[str, Any],
+    agent_filter: Optional[str],
+    tags: Optional[List[str]],
+    priority: Optional[Priority]
+) -> bool:
+    """Single-entry predicate mirroring filter_memories (no date range)."""
+    if agent_filter and entry.get("agent_name") != agent_filter:
+        return False
+    if tags and not all(tag in entry.get("tags", []) for tag in tags):
+        return False
+    if priority and entry.get("priority") != priority.value:
+        return False
+    return True
 
 
 def sort_memories(
@@ -388,21 +1169,68 @@ def sort_memories(
 ) -> List[Dict[str, Any]]:
     """Sort memory entries according to specified order."""
     if sort_order == SortOrder.REVERSE:
-        return list(reversed(memories))
+        return memories[::-1]
     elif sort_order == SortOrder.PRIORITY:
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        return sorted(
-            memories,
-            key=lambda m: priority_order.get(m.get("priority", "medium"), 1)
-        )
+        # Three-bucket counting sort: O(N) with no per-comparison Python
+        # callback, and stable within each priority like sorted() was
+        high: List[Dict[str, Any]] = []
+        medium: List[Dict[str, Any]] = []
+        low: List[Dict[str, Any]] = []
+        buckets = {"high": high, "medium": medium, "low": low}
+        for m in memories:
+            buckets.get(m.get("priority", "medium"), medium).append(m)
+        return high + medium + low
     else:  # CHRONOLOGICAL (default)
         return memories
 
 
+_PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2}
+
+
+def dedup_memories(memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse entries with identical trimmed content, keeping the best one.
+
+    "Best" is the highest-priority instance, with the newest timestamp
+    breaking ties. The surviving entries keep their chronological order.
+
+    Args:
+        memories: List of memory entries
+
+    Returns:
+        List with at most one entry per distinct content
+    """
+    best: Dict[str, tuple] = {}  # content -> ((priority rank, timestamp), position)
+    for position, entry in enumerate(memories):
+        key = entry.get("content", "").strip()
+        rank = (
+            _PRIORITY_RANK.get(entry.get("priority", "medium"), 1),
+            entry.get("timestamp") or ""
+        )
+        kept = best.get(key)
+        if kept is None or rank > kept[0]:
+            best[key] = (rank, position)
+
+    keep = {position for _, position in best.values()}
+    return [entry for position, entry in enumerate(memories) if position in keep]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_search_pattern(query: str, case_sensitive: bool, regex: bool = False) -> "re.Pattern":
+    """Compile (and memoize) the pattern for a search query.
+
+    Literal queries are escaped; regex queries are compiled as-is and may
+    raise re.error for an invalid pattern.
+    """
+    return re.compile(query if regex else re.escape(query), 0 if case_sensitive else re.IGNORECASE)
+
+
 def search_memories(
     memories: List[Dict[str, Any]],
     query: str,
-    case_sensitive: bool = False
+    case_sensitive: bool = False,
+    regex: bool = False,
+    limit: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Search memory entries for a query string.
@@ -413,45 +1241,78 @@ def search_memories(
         memories: List of memory entries
         query: Search query string
         case_sensitive: Whether search should be case-sensitive
+        regex: Treat the query as a regular expression instead of a
+            literal substring
+        limit: Stop scanning once this many matches are found
 
     Returns:
         List of matching memory entries
+
+    Raises:
+        re.error: If `regex` is True and the query is not a valid pattern
     """
     if not query:
-        return memories
-
+        return memories if limit is None else memories[:limit]
+
+    # The regex engine scans in C without materializing lowercased copies
+    # of every field; patterns are memoized across calls
+    search = _compile_search_pattern(query, case_sensitive, regex).search
+
+    # Searching the cached store: intersect the trigram posting sets to
+    # narrow the scan to candidate entries, then verify only those. A
+    # substring match implies every trigram of the query appears in the
+    # matched field, so candidates are a guaranteed superset (queries
+    # shorter than a trigram have no postings and fall through). Regex
+    # queries can match text that shares no trigram with the pattern
+    # source, so they always take the full scan
+    candidates = None
+    if not regex and len(query) >= 3:
+        candidates = _trigram_candidates(memories, query)
+    if candidates is None:
+        candidates = memories
+
+    # Fields ordered cheapest-first so the OR short-circuits before
+    # touching the long content string whenever a small field matches
     results = []
-    search_pattern = query if case_sensitive else query.lower()
-
-    for entry in memories:
-        # Search in content
-        content = entry.get("content", "")
-        if not case_sensitive:
-            content = content.lower()
-
-        if search_pattern in content:
-            results.append(entry)
-            continue
-
-        # Search in agent name
-        agent_name = entry.get("agent_name", "")
-        if not case_sensitive:
-            agent_name = agent_name.lower()
-
-        if search_pattern in agent_name:
+    for entry in candidates:
+        if (
+            search(entry.get("agent_name", ""))
+            or any(search(tag) for tag in entry.get("tags", []))
+            or search(entry.get("content", ""))
+        ):
             results.append(entry)
-            continue
+            # Early exit: with a limit there is no point verifying the
+            # remaining candidates once the cap is reached
+            if limit is not None and len(results) >= limit:
+                break
 
-        # Search in tags
-        tags = entry.get("tags", [])
-        if not case_sensitive:
-            tags = [t.lower() for t in tags]
+    return results
 
-        if any(search_pattern in tag for tag in tags):
-            results.append(entry)
-            continue
 
-    return results
+def _markdown_entry_block(index: int, entry: Dict[str, Any]) -> str:
+    """Render a single memory entry as a markdown block."""
+    entry_id = entry.get('entry_id', 'unknown')
+    timestamp = entry.get('timestamp', 'unknown')
+    agent = entry.get('agent_name', 'unknown')
+    content = entry.get('content', '')
+    words = entry.get('word_count', 0)
+    priority = entry.get('priority', 'medium')
+    tags = entry.get('tags', [])
+    updated_at = entry.get('updated_at')
+
+    updated_line = f"\n**Updated**: {updated_at}" if updated_at else ""
+    tags_line = f"\n**Tags**: {', '.join(tags)}" if tags else ""
+
+    return (
+        f"## Entry {index}: {agent}\n"
+        f"**ID**: `{entry_id}`\n"
+        f"**Time**: {timestamp}"
+        f"{updated_line}\n"
+        f"**Words**: {words}/{MAX_WORDS_PER_ENTRY}\n"
+        f"**Priority**: {priority}"
+        f"{tags_line}\n"
+        f"\n{content}\n\n---\n"
+    )
 
 
 def format_memories_as_markdown(memories: List[Dict[str, Any]]) -> str:
@@ -459,40 +1320,31 @@ def format_memories_as_markdown(memories: List[Dict[str, Any]]) -> str:
     if not memories:
         return "No memory entries found."
 
-    lines = ["# Shared Memory\n"]
-    lines.append(f"Total entries: {len(memories)}\n")
-
-    for i, entry in enumerate(memories, 1):
-        entry_id = entry.get('entry_id', 'unknown')
-        timestamp = entry.get('timestamp', 'unknown')
-        agent = entry.get('agent_name', 'unknown')
-        content = entry.get('content', '')
-        words = entry.get('word_count', 0)
-        priority = entry.get('priority', 'medium')
-        tags = entry.get('tags', [])
-        updated_at = entry.get('updated_at')
-
-        lines.append(f"## Entry {i}: {agent}")
-        lines.append(f"**ID**: `{entry_id}`")
-        lines.append(f"**Time**: {timestamp}")
-        if updated_at:
-            lines.append(f"**Updated**: {updated_at}")
-        lines.append(f"**Words**: {words}/{MAX_WORDS_PER_ENTRY}")
-        lines.append(f"**Priority**: {priority}")
-        if tags:
-            lines.append(f"**Tags**: {', '.join(tags)}")
-        lines.append(f"\n{content}\n")
-        lines.append("---\n")
-
-    return "\n".join(lines)
+    # One pre-assembled block per entry keeps string allocations to a
+    # handful per entry instead of one per line
+    blocks = [f"# Shared Memory\n\nTotal entries: {len(memories)}\n"]
+    blocks.extend(
+        _markdown_entry_block(i, entry) for i, entry in enumerate(memories, 1)
+    )
+
+    return "\n".join(blocks)
 
 
 def format_memories_as_json(memories: List[Dict[str, Any]]) -> str:
     """Format memory entries as JSON."""
-    return json.dumps({
+    if orjson is not None:
+        # Write the two-field wrapper by hand so the entry list is the only
+        # object the serializer walks (skips the wrapper dict allocation)
+        option = orjson.OPT_INDENT_2 if JSON_INDENT is not None else 0
+        entries_json = orjson.dumps(memories, option=option).decode("utf-8")
+        if JSON_INDENT is not None:
+            return f'{{\n  "total_entries": {len(memories)},\n  "entries": {entries_json}\n}}'
+        return f'{{"total_entries":{len(memories)},"entries":{entries_json}}}'
+
+    return _json_dumps({
         "total_entries": len(memories),
         "entries": memories
-    }, indent=2)
+    })
 
 
 # Tool Input Models
@@ -501,8 +1353,8 @@ class AddMemoryInput(BaseModel):
     """Input model for adding a memory entry."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     agent_name: str = Field(
@@ -514,8 +1366,9 @@ class AddMemoryInput(BaseModel):
 
     content: str = Field(
         ...,
-        description="The memory content to store. Maximum 200 words.",
-        min_length=1
+        description="The memory content to store. Maximum 200 words (100,000 characters).",
+        min_length=1,
+        max_length=MAX_CONTENT_LENGTH
     )
 
     tags: List[str] = Field(
@@ -534,6 +1387,11 @@ class AddMemoryInput(BaseModel):
         description="Optional metadata for this entry"
     )
 
+    dedup: bool = Field(
+        default=False,
+        description="Skip the write if an entry with identical content already exists"
+    )
+
     @field_validator('content')
     @classmethod
     def validate_word_count(cls, v: str) -> str:
@@ -552,8 +1410,13 @@ class AddMemoryInput(BaseModel):
         """Validate tags list."""
         if len(v) > 10:
             raise ValueError("Maximum 10 tags allowed per entry")
-        # Strip whitespace and convert to lowercase
-        return [tag.strip().lower() for tag in v if tag.strip()]
+        # Normalize and dedupe in one pass: a single strip per tag, with
+        # the seen-set trick dropping repeats for free
+        seen: set = set()
+        return [
+            t for t in (tag.strip().lower() for tag in v)
+            if t and not (t in seen or seen.add(t))
+        ]
 
 
 @mcp.tool(
@@ -588,11 +1451,29 @@ async def add_memory(params: AddMemoryInput) -> str:
         ... )
     """
     try:
-        # Load existing memories
-        memories = load_memories()
+        # Opt-in ingest dedup: an identical-content entry already in the
+        # store answers the call instead of growing it
+        if params.dedup:
+            memories = await _load_memories_async()
+            for existing in memories:
+                if existing.get("content", "") == params.content:
+                    logger.debug(
+                        "Duplicate entry skipped",
+                        agent_name=params.agent_name,
+                        entry_id=existing.get("entry_id")
+                    )
+                    return _json_dumps({
+                        "success": True,
+                        "deduplicated": True,
+                        "entry_id": existing.get("entry_id"),
+                        "timestamp": existing.get("timestamp"),
+                        "agent_name": existing.get("agent_name"),
+                        "word_count": existing.get("word_count"),
+                        "message": "Identical entry already stored; no new entry added"
+                    })
 
         # Create new entry
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = _now_iso()
         entry_id = generate_entry_id()
         word_count = count_words(params.content)
 
@@ -608,15 +1489,14 @@ async def add_memory(params: AddMemoryInput) -> str:
             "updated_at": None
         }
 
-        # Append and save
-        memories.append(entry)
-        save_memories(memories)
+        # Append to the log (O(1) in store size, no full rewrite)
+        entry_number = await asyncio.to_thread(append_entry, entry)
 
         # Log operation
         logger.log_add_memory(
             agent_name=params.agent_name,
             word_count=word_count,
-            entry_number=len(memories),
+            entry_number=entry_number,
             success=True
         )
 
@@ -624,16 +1504,16 @@ async def add_memory(params: AddMemoryInput) -> str:
         result = {
             "success": True,
             "entry_id": entry_id,
-            "entry_number": len(memories),
+            "entry_number": entry_number,
             "timestamp": timestamp,
             "agent_name": params.agent_name,
             "word_count": word_count,
             "tags": params.tags,
             "priority": params.priority.value,
-            "message": f"Memory entry #{len(memories)} added successfully by {params.agent_name}"
+            "message": f"Memory entry #{entry_number} added successfully by {params.agent_name}"
         }
 
-        return json.dumps(result, indent=2)
+        return _json_dumps(result)
 
     except Exception as e:
         logger.log_add_memory(
@@ -643,18 +1523,18 @@ async def add_memory(params: AddMemoryInput) -> str:
             success=False,
             error=str(e)
         )
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to add memory: {str(e)}"
-        }, indent=2)
+        })
 
 
 class ReadMemoryInput(BaseModel):
     """Input model for reading memory entries."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     response_format: ResponseFormat = Field(
@@ -691,6 +1571,115 @@ class ReadMemoryInput(BaseModel):
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _render_read_response(
+    storage_key: tuple,
+    response_format: ResponseFormat,
+    agent_filter: Optional[str],
+    tags: Optional[tuple],
+    priority: Optional[Priority],
+    sort_order: SortOrder,
+    limit: Optional[int]
+) -> tuple:
+    """
+    Render a read_memory response, cached by storage state and parameters.
+
+    storage_key identifies the on-disk storage state, so any write
+    naturally invalidates stale renders. The common "read, think, read
+    again" agent pattern hits the cache on the second read.
+
+    Returns:
+        tuple: (result string, shown entry count, total entry count, truncated)
+    """
+    memories = load_memories()
+    total_count = len(memories)
+
+    tag_list = list(tags) if tags else None
+
+    # Agent-filtered reads start from the agent index: O(K) entries by that
+    # agent instead of an O(N) scan over the whole store
+    if agent_filter and memories is _cache:
+        memories = _get_agent_index().get(agent_filter, [])
+        agent_filter = None
+
+    if limit and sort_order == SortOrder.CHRONOLOGICAL:
+        # Fast path: filter and keep the last `limit` matches in one pass
+        # with O(limit) memory instead of materializing the full match list
+        memories = list(deque(
+            (m for m in memories if _entry_matches(m, agent_filter, tag_list, priority)),
+            maxlen=limit
+        ))
+    else:
+        # Apply filters
+        memories = filter_memories(
+            memories,
+            agent_filter=agent_filter,
+            tags=tag_list,
+            priority=priority
+        )
+
+        # Apply sorting
+        memories = sort_memories(memories, sort_order)
+
+        # Apply limit if specified (get most recent after sorting)
+        if limit and len(memories) > limit:
+            memories = memories[:limit]
+
+    # Format response
+    if response_format == ResponseFormat.MARKDOWN:
+        result = format_memories_as_markdown(memories)
+    else:
+        result = format_memories_as_json(memories)
+
+    truncated = False
+    if len(result) > CHARACTER_LIMIT:
+        truncated = True
+
+        # Size each rendered entry once and keep the largest suffix that
+        # fits, instead of halving and re-rendering until it does
+        if len(memories) > 1:
+            if response_format == ResponseFormat.MARKDOWN:
+                sizes = [
+                    len(_markdown_entry_block(i, entry)) + 1
+                    for i, entry in enumerate(memories, 1)
+                ]
+            else:
+                sizes = [len(_json_dumps(entry)) + 8 for entry in memories]
+
+            budget = CHARACTER_LIMIT - 512  # headroom for wrapper + notice
+            kept = 0
+            cumulative = 0
+            for size in reversed(sizes):
+                if cumulative + size > budget:
+                    break
+                cumulative += size
+                kept += 1
+            memories = memories[-max(kept, 1):]
+
+            if response_format == ResponseFormat.MARKDOWN:
+                result = format_memories_as_markdown(memories)
+            else:
+                result = format_memories_as_json(memories)
+
+        # Safety net for estimate drift (e.g. deep metadata indentation):
+        # fall back to halving, which previously was the only strategy
+        while len(result) > CHARACTER_LIMIT and len(memories) > 1:
+            memories = memories[-(len(memories) // 2):]
+
+            if response_format == ResponseFormat.MARKDOWN:
+                result = format_memories_as_markdown(memories)
+            else:
+                result = format_memories_as_json(memories)
+
+        truncation_notice = (
+            f"\n\n⚠️ **Response Truncated**: Showing {len(memories)} of "
+            f"{total_count} entries. Use 'limit' parameter to control results."
+        )
+        result = result + truncation_notice
+
+    return result, len(memories), total_count, truncated
+
+
 @mcp.tool(
     name="read_memory",
     annotations={
@@ -718,56 +1707,32 @@ async def read_memory(params: ReadMemoryInput) -> str:
         >>> read_memory(response_format="markdown", tags=["analysis"], priority="high")
     """
     try:
-        # Load memories
-        memories = load_memories()
-        total_count = len(memories)
-
-        # Apply filters
-        memories = filter_memories(
-            memories,
-            agent_filter=params.agent_filter,
-            tags=params.tags,
-            priority=params.priority
+        # Refresh the storage cache so the render cache key is current
+        await _load_memories_async()
+
+        render_args = (
+            params.response_format,
+            params.agent_filter,
+            tuple(params.tags) if params.tags else None,
+            params.priority,
+            params.sort_order,
+            params.limit
         )
 
-        # Apply sorting
-        memories = sort_memories(memories, params.sort_order)
-
-        # Apply limit if specified (get most recent after sorting)
-        if params.limit and len(memories) > params.limit:
-            if params.sort_order == SortOrder.CHRONOLOGICAL:
-                memories = memories[-params.limit:]
-            else:
-                memories = memories[:params.limit]
-
-        # Format response
-        if params.response_format == ResponseFormat.MARKDOWN:
-            result = format_memories_as_markdown(memories)
+        if _cache_key is not None:
+            result, shown_count, _, truncated = _render_read_response(
+                _cache_key, *render_args
+            )
         else:
-            result = format_memories_as_json(memories)
-
-        truncated = False
-        # Check character limit
-        if len(result) > CHARACTER_LIMIT:
-            truncated_count = len(memories) // 2
-            memories = memories[-truncated_count:]
-
-            if params.response_format == ResponseFormat.MARKDOWN:
-                result = format_memories_as_markdown(memories)
-            else:
-                result = format_memories_as_json(memories)
-
-            truncation_notice = (
-                f"\n\n⚠️ **Response Truncated**: Showing {truncated_count} of "
-                f"{total_count} entries. Use 'limit' parameter to control results."
+            # Storage state unknown: render without caching
+            result, shown_count, _, truncated = _render_read_response.__wrapped__(
+                None, *render_args
             )
-            result = result + truncation_notice
-            truncated = True
 
         # Log operation
         logger.log_read_memory(
             format=params.response_format.value,
-            entry_count=len(memories),
+            entry_count=shown_count,
             agent_filter=params.agent_filter,
             limit=params.limit,
             truncated=truncated
@@ -777,18 +1742,18 @@ async def read_memory(params: ReadMemoryInput) -> str:
 
     except Exception as e:
         logger.error(f"Failed to read memory", exc_info=True)
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to read memory: {str(e)}"
-        }, indent=2)
+        })
 
 
 class UpdateMemoryInput(BaseModel):
     """Input model for updating a memory entry."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     entry_id: str = Field(
@@ -798,8 +1763,9 @@ class UpdateMemoryInput(BaseModel):
 
     content: Optional[str] = Field(
         default=None,
-        description="New content (max 200 words). If not provided, content unchanged.",
-        min_length=1
+        description="New content (max 200 words, 100,000 characters). If not provided, content unchanged.",
+        min_length=1,
+        max_length=MAX_CONTENT_LENGTH
     )
 
     tags: Optional[List[str]] = Field(
@@ -865,47 +1831,57 @@ async def update_memory(params: UpdateMemoryInput) -> str:
     try:
         # Validate entry ID format
         if not validate_entry_id(params.entry_id):
-            return json.dumps({
+            return _json_dumps({
                 "success": False,
                 "error": f"Invalid entry_id format: {params.entry_id}"
-            }, indent=2)
+            })
 
         # Load memories
-        memories = load_memories()
+        memories = await _load_memories_async()
 
         # Find entry
         entry = find_entry_by_id(memories, params.entry_id)
         if entry is None:
-            return json.dumps({
+            return _json_dumps({
                 "success": False,
                 "error": f"Entry not found with ID: {params.entry_id}"
-            }, indent=2)
+            })
 
-        # Update fields
+        # Collect changed fields
         updated_fields = []
+        changed: Dict[str, Any] = {}
 
         if params.content is not None:
-            entry["content"] = params.content
-            entry["word_count"] = count_words(params.content)
+            changed["content"] = params.content
+            changed["word_count"] = count_words(params.content)
             updated_fields.append("content")
 
         if params.tags is not None:
-            entry["tags"] = [tag.strip().lower() for tag in params.tags if tag.strip()]
+            seen: set = set()
+            changed["tags"] = [
+                t for t in (tag.strip().lower() for tag in params.tags)
+                if t and not (t in seen or seen.add(t))
+            ]
             updated_fields.append("tags")
 
         if params.priority is not None:
-            entry["priority"] = params.priority.value
+            changed["priority"] = params.priority.value
             updated_fields.append("priority")
 
         if params.metadata is not None:
-            entry["metadata"] = params.metadata
+            changed["metadata"] = params.metadata
             updated_fields.append("metadata")
 
         # Update timestamp
-        entry["updated_at"] = datetime.now(timezone.utc).isoformat()
+        changed["updated_at"] = _now_iso()
+        entry.update(changed)
 
-        # Save
-        save_memories(memories)
+        # Persist as one delta record instead of rewriting the store
+        await asyncio.to_thread(append_delta, {
+            "op": "update",
+            "entry_id": params.entry_id,
+            "fields": changed
+        }, memories)
 
         # Log operation
         logger.log_update_memory(
@@ -922,7 +1898,7 @@ async def update_memory(params: UpdateMemoryInput) -> str:
             "message": f"Entry {params.entry_id} updated successfully"
         }
 
-        return json.dumps(result, indent=2)
+        return _json_dumps(result)
 
     except Exception as e:
         logger.log_update_memory(
@@ -931,18 +1907,18 @@ async def update_memory(params: UpdateMemoryInput) -> str:
             success=False,
             error=str(e)
         )
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to update memory: {str(e)}"
-        }, indent=2)
+        })
 
 
 class DeleteMemoryInput(BaseModel):
     """Input model for deleting a memory entry."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     entry_id: str = Field(
@@ -977,28 +1953,37 @@ async def delete_memory(params: DeleteMemoryInput) -> str:
     try:
         # Validate entry ID format
         if not validate_entry_id(params.entry_id):
-            return json.dumps({
+            return _json_dumps({
                 "success": False,
                 "error": f"Invalid entry_id format: {params.entry_id}"
-            }, indent=2)
+            })
 
         # Load memories
-        memories = load_memories()
+        memories = await _load_memories_async()
         original_count = len(memories)
 
         # Find and remove entry
         entry = find_entry_by_id(memories, params.entry_id)
         if entry is None:
-            return json.dumps({
+            return _json_dumps({
                 "success": False,
                 "error": f"Entry not found with ID: {params.entry_id}"
-            }, indent=2)
-
-        # Remove entry
-        memories = [m for m in memories if m.get("entry_id") != params.entry_id]
-
-        # Save
-        save_memories(memories)
+            })
+
+        # Remove entry in place: one O(N) shift instead of rebuilding and
+        # re-scanning the whole list. Storage order doubles as the
+        # chronological read order, so a swap-with-last delete is not an
+        # option here.
+        for position, m in enumerate(memories):
+            if m is entry:
+                del memories[position]
+                break
+
+        # Persist as one delta record instead of rewriting the store
+        await asyncio.to_thread(append_delta, {
+            "op": "delete",
+            "entry_id": params.entry_id
+        }, memories)
 
         # Log operation
         logger.log_delete_memory(entry_id=params.entry_id, success=True)
@@ -1007,27 +1992,27 @@ async def delete_memory(params: DeleteMemoryInput) -> str:
             "success": True,
             "entry_id": params.entry_id,
             "agent_name": entry.get("agent_name"),
-            "deleted_at": datetime.now(timezone.utc).isoformat(),
+            "deleted_at": _now_iso(),
             "remaining_entries": len(memories),
             "message": f"Entry {params.entry_id} deleted successfully"
         }
 
-        return json.dumps(result, indent=2)
+        return _json_dumps(result)
 
     except Exception as e:
         logger.log_delete_memory(entry_id=params.entry_id, success=False, error=str(e))
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to delete memory: {str(e)}"
-        }, indent=2)
+        })
 
 
 class GetMemoryInput(BaseModel):
     """Input model for getting a single memory entry."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     entry_id: str = Field(
@@ -1051,6 +2036,7 @@ class GetMemoryInput(BaseModel):
         "openWorldHint": False
     }
 )
+@_memoize_response
 async def get_memory(params: GetMemoryInput) -> str:
     """
     Retrieve a single memory entry by its ID.
@@ -1067,30 +2053,30 @@ async def get_memory(params: GetMemoryInput) -> str:
     try:
         # Validate entry ID format
         if not validate_entry_id(params.entry_id):
-            return json.dumps({
+            return _json_dumps({
                 "success": False,
                 "error": f"Invalid entry_id format: {params.entry_id}"
-            }, indent=2)
+            })
 
         # Load memories
-        memories = load_memories()
+        memories = await _load_memories_async()
 
         # Find entry
         entry = find_entry_by_id(memories, params.entry_id)
         if entry is None:
-            return json.dumps({
+            return _json_dumps({
                 "success": False,
                 "error": f"Entry not found with ID: {params.entry_id}"
-            }, indent=2)
+            })
 
         # Format response
         if params.response_format == ResponseFormat.MARKDOWN:
             result = format_memories_as_markdown([entry])
         else:
-            result = json.dumps({
+            result = _json_dumps({
                 "success": True,
                 "entry": entry
-            }, indent=2)
+            })
 
         logger.debug("Retrieved single memory entry", entry_id=params.entry_id)
 
@@ -1098,18 +2084,18 @@ async def get_memory(params: GetMemoryInput) -> str:
 
     except Exception as e:
         logger.error(f"Failed to get memory entry", entry_id=params.entry_id, exc_info=True)
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to get memory: {str(e)}"
-        }, indent=2)
+        })
 
 
 class SearchMemoryInput(BaseModel):
     """Input model for searching memory entries."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     query: str = Field(
@@ -1124,6 +2110,11 @@ class SearchMemoryInput(BaseModel):
         description="Whether search should be case-sensitive"
     )
 
+    regex: bool = Field(
+        default=False,
+        description="Treat the query as a regular expression instead of a literal substring"
+    )
+
     response_format: ResponseFormat = Field(
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' or 'json'"
@@ -1147,6 +2138,7 @@ class SearchMemoryInput(BaseModel):
         "openWorldHint": False
     }
 )
+@_memoize_response
 async def search_memory(params: SearchMemoryInput) -> str:
     """
     Search memory entries for a query string.
@@ -1166,14 +2158,20 @@ async def search_memory(params: SearchMemoryInput) -> str:
         start_time = time.time()
 
         # Load memories
-        memories = load_memories()
-
-        # Search
-        results = search_memories(memories, params.query, params.case_sensitive)
+        memories = await _load_memories_async()
 
-        # Apply limit
-        if params.limit and len(results) > params.limit:
-            results = results[:params.limit]
+        # Search; the limit is pushed into the scan so it stops early
+        # instead of matching everything and slicing afterwards
+        try:
+            results = search_memories(
+                memories, params.query, params.case_sensitive, params.regex,
+                limit=params.limit
+            )
+        except re.error as e:
+            return _json_dumps({
+                "success": False,
+                "error": f"Invalid regex query: {str(e)}"
+            })
 
         # Format response
         if params.response_format == ResponseFormat.MARKDOWN:
@@ -1181,12 +2179,12 @@ async def search_memory(params: SearchMemoryInput) -> str:
             if results:
                 result = f"# Search Results for: \"{params.query}\"\n\n" + result
         else:
-            result = json.dumps({
+            result = _json_dumps({
                 "success": True,
                 "query": params.query,
                 "total_results": len(results),
                 "entries": results
-            }, indent=2)
+            })
 
         search_time = (time.time() - start_time) * 1000
 
@@ -1201,18 +2199,18 @@ async def search_memory(params: SearchMemoryInput) -> str:
 
     except Exception as e:
         logger.error(f"Failed to search memory", query=params.query, exc_info=True)
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to search memory: {str(e)}"
-        }, indent=2)
+        })
 
 
 class GetMemoryStatsInput(BaseModel):
     """Input model for getting memory statistics."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     response_format: ResponseFormat = Field(
@@ -1231,6 +2229,7 @@ class GetMemoryStatsInput(BaseModel):
         "openWorldHint": False
     }
 )
+@_memoize_response
 async def get_memory_stats(params: GetMemoryStatsInput) -> str:
     """
     Get statistics about the shared memory.
@@ -1254,43 +2253,22 @@ async def get_memory_stats(params: GetMemoryStatsInput) -> str:
     """
     try:
         # Load memories
-        memories = load_memories()
+        memories = await _load_memories_async()
 
         if not memories:
-            return json.dumps({
+            return _json_dumps({
                 "success": True,
                 "total_entries": 0,
                 "message": "No memory entries found"
-            }, indent=2)
+            })
 
-        # Calculate statistics
-        total_entries = len(memories)
-        total_words = sum(m.get("word_count", 0) for m in memories)
-
-        # Agent activity
-        agent_counts = {}
-        for m in memories:
-            agent = m.get("agent_name", "unknown")
-            agent_counts[agent] = agent_counts.get(agent, 0) + 1
-
-        # Tag usage
-        tag_counts = {}
-        for m in memories:
-            for tag in m.get("tags", []):
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        # Priority distribution
-        priority_counts = {"low": 0, "medium": 0, "high": 0}
-        for m in memories:
-            priority = m.get("priority", "medium")
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
-
-        # Date range
-        timestamps = [m.get("timestamp") for m in memories if m.get("timestamp")]
-        date_range = {
-            "earliest": min(timestamps) if timestamps else None,
-            "latest": max(timestamps) if timestamps else None
-        }
+        aggregates = _get_aggregates(memories)
+        total_entries = aggregates["total_entries"]
+        total_words = aggregates["total_words"]
+        agent_counts = aggregates["agent_counts"]
+        tag_counts = aggregates["tag_counts"]
+        priority_counts = aggregates["priority_counts"]
+        date_range = aggregates["date_range"]
 
         # Storage size
         storage_size = MEMORY_FILE.stat().st_size if MEMORY_FILE.exists() else 0
@@ -1301,9 +2279,9 @@ async def get_memory_stats(params: GetMemoryStatsInput) -> str:
             "total_words": total_words,
             "average_words_per_entry": round(total_words / total_entries, 1) if total_entries > 0 else 0,
             "agent_activity": agent_counts,
-            "top_agents": sorted(agent_counts.items(), key=lambda x: x[1], reverse=True)[:5],
+            "top_agents": agent_counts.most_common(5),
             "tag_usage": tag_counts,
-            "top_tags": sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10],
+            "top_tags": tag_counts.most_common(10),
             "priority_distribution": priority_counts,
             "date_range": date_range,
             "storage_size_bytes": storage_size,
@@ -1313,36 +2291,37 @@ async def get_memory_stats(params: GetMemoryStatsInput) -> str:
         }
 
         if params.response_format == ResponseFormat.MARKDOWN:
-            # Format as markdown
-            lines = ["# Memory Statistics\n"]
-            lines.append(f"**Total Entries**: {stats['total_entries']}")
-            lines.append(f"**Total Words**: {stats['total_words']:,}")
-            lines.append(f"**Average Words/Entry**: {stats['average_words_per_entry']}")
-            lines.append(f"**Storage Size**: {stats['storage_size_kb']} KB\n")
-
-            lines.append("## Agent Activity")
-            for agent, count in stats['top_agents']:
-                lines.append(f"- {agent}: {count} entries")
-            lines.append("")
-
+            # Format as markdown: pre-join the per-item sections and emit
+            # the static layout as one template instead of ~30 list appends
+            agent_lines = "\n".join(
+                f"- {agent}: {count} entries" for agent, count in stats['top_agents']
+            )
+            tag_section = ""
             if stats['top_tags']:
-                lines.append("## Top Tags")
-                for tag, count in stats['top_tags']:
-                    lines.append(f"- {tag}: {count} uses")
-                lines.append("")
-
-            lines.append("## Priority Distribution")
-            for priority, count in stats['priority_distribution'].items():
-                lines.append(f"- {priority.capitalize()}: {count} entries")
-            lines.append("")
-
-            lines.append("## Date Range")
-            lines.append(f"- **Earliest**: {stats['date_range']['earliest']}")
-            lines.append(f"- **Latest**: {stats['date_range']['latest']}")
+                tag_lines = "\n".join(
+                    f"- {tag}: {count} uses" for tag, count in stats['top_tags']
+                )
+                tag_section = f"## Top Tags\n{tag_lines}\n\n"
+            priority_lines = "\n".join(
+                f"- {priority.capitalize()}: {count} entries"
+                for priority, count in stats['priority_distribution'].items()
+            )
 
-            result = "\n".join(lines)
+            result = (
+                f"# Memory Statistics\n\n"
+                f"**Total Entries**: {stats['total_entries']}\n"
+                f"**Total Words**: {stats['total_words']:,}\n"
+                f"**Average Words/Entry**: {stats['average_words_per_entry']}\n"
+                f"**Storage Size**: {stats['storage_size_kb']} KB\n\n"
+                f"## Agent Activity\n{agent_lines}\n\n"
+                f"{tag_section}"
+                f"## Priority Distribution\n{priority_lines}\n\n"
+                f"## Date Range\n"
+                f"- **Earliest**: {stats['date_range']['earliest']}\n"
+                f"- **Latest**: {stats['date_range']['latest']}"
+            )
         else:
-            result = json.dumps(stats, indent=2)
+            result = _json_dumps(stats)
 
         logger.info("Retrieved memory statistics", total_entries=total_entries)
 
@@ -1350,18 +2329,18 @@ async def get_memory_stats(params: GetMemoryStatsInput) -> str:
 
     except Exception as e:
         logger.error("Failed to get memory statistics", exc_info=True)
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to get statistics: {str(e)}"
-        }, indent=2)
+        })
 
 
 class ClearMemoryInput(BaseModel):
     """Input model for clearing memory."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+        extra='forbid',
+        frozen=True
     )
 
     confirm: bool = Field(
@@ -1398,20 +2377,22 @@ async def clear_memory(params: ClearMemoryInput) -> str:
     """
     try:
         if not params.confirm:
-            return json.dumps({
+            return _json_dumps({
                 "success": False,
                 "error": "Confirmation required. Set 'confirm' parameter to true."
-            }, indent=2)
-
-        # Load current memories to count them
-        memories = load_memories()
-        count = len(memories)
+            })
 
-        # Create backup before clearing
-        create_backup()
+        # Count entries for the response; the warm cache answers directly
+        # without the storage round-trip
+        if _cache is not None and _storage_key() == _cache_key:
+            count = len(_cache)
+        else:
+            count = len(await _load_memories_async())
 
-        # Clear memory
-        save_memories([])
+        # Clear memory; save_memories backs up the pre-clear snapshot
+        # itself (a hardlink, so zero-copy) before writing the empty state.
+        # fold_log=False: a wipe discards pending log records by design
+        await _save_memories_async([], fold_log=False)
 
         # Log operation
         logger.log_clear_memory(entries_cleared=count, success=True)
@@ -1419,23 +2400,33 @@ async def clear_memory(params: ClearMemoryInput) -> str:
         result = {
             "success": True,
             "entries_cleared": count,
-            "cleared_at": datetime.now(timezone.utc).isoformat(),
+            "cleared_at": _now_iso(),
             "message": f"Successfully cleared {count} memory entries. Backup created."
         }
 
-        return json.dumps(result, indent=2)
+        return _json_dumps(result)
 
     except Exception as e:
         logger.log_clear_memory(entries_cleared=0, success=False)
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Failed to clear memory: {str(e)}"
-        }, indent=2)
+        })
+
+
+def _probe_lock() -> None:
+    """Briefly acquire and release the storage lock (health probe).
+
+    Runs in a worker thread from health_check so a contended lock stalls
+    the probe, not the event loop.
+    """
+    with file_lock(MEMORY_FILE, timeout=0.5):
+        pass
 
 
 class HealthCheckInput(BaseModel):
     """Input model for health check."""
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='forbid', frozen=True)
 
 
 @mcp.tool(
@@ -1467,18 +2458,20 @@ async def health_check(params: HealthCheckInput) -> str:
     try:
         health_status = {
             "success": True,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "checks": {}
         }
 
-        # Check storage file exists and is readable
+        # Check storage file exists and is readable; one stat serves both
+        # the existence and size probes
         try:
             ensure_storage_structure()
+            storage_stat = MEMORY_FILE.stat()
             health_status["checks"]["storage_file"] = {
                 "status": "ok",
                 "path": str(MEMORY_FILE),
-                "exists": MEMORY_FILE.exists(),
-                "size_bytes": MEMORY_FILE.stat().st_size if MEMORY_FILE.exists() else 0
+                "exists": True,
+                "size_bytes": storage_stat.st_size
             }
         except Exception as e:
             health_status["checks"]["storage_file"] = {
@@ -1487,10 +2480,10 @@ async def health_check(params: HealthCheckInput) -> str:
             }
             health_status["success"] = False
 
-        # Check file locking
+        # Check file locking: a short-timeout probe, so frequent health
+        # polling never sits behind a writer for seconds
         try:
-            with file_lock(MEMORY_FILE, timeout=5.0) as f:
-                pass
+            await asyncio.to_thread(_probe_lock)
             health_status["checks"]["file_locking"] = {
                 "status": "ok",
                 "message": "File locking operational"
@@ -1502,9 +2495,11 @@ async def health_check(params: HealthCheckInput) -> str:
             }
             health_status["success"] = False
 
-        # Check JSON validity
+        # Check JSON validity; load_memories serves this from the
+        # in-process cache when storage hasn't changed, so repeated
+        # health probes don't re-read or re-parse the file
         try:
-            memories = load_memories()
+            memories = await _load_memories_async()
             health_status["checks"]["json_parsing"] = {
                 "status": "ok",
                 "entry_count": len(memories)
@@ -1518,7 +2513,7 @@ async def health_check(params: HealthCheckInput) -> str:
 
         # Check backup directory
         try:
-            backups = list(BACKUP_DIR.glob("memory_backup_*.json"))
+            backups = _list_backups()
             health_status["checks"]["backup_system"] = {
                 "status": "ok",
                 "backup_dir": str(BACKUP_DIR),
@@ -1538,17 +2533,25 @@ async def health_check(params: HealthCheckInput) -> str:
 
         logger.info("Health check completed", success=health_status["success"])
 
-        return json.dumps(health_status, indent=2)
+        return _json_dumps(health_status)
 
     except Exception as e:
         logger.error("Health check failed", exc_info=True)
-        return json.dumps({
+        return _json_dumps({
             "success": False,
             "error": f"Health check failed: {str(e)}"
-        }, indent=2)
+        })
 
 
 # Main entry point
 if __name__ == "__main__":
+    # Use uvloop for faster task scheduling when it's installed
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("uvloop event loop installed")
+    except ImportError:
+        pass
+
     logger.info("Starting MCP Agent Memory Server", version=STORAGE_VERSION)
     mcp.run()
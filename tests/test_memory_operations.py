@@ -22,11 +22,13 @@ from shared_memory_mcp import (
     filter_memories,
     sort_memories,
     search_memories,
+    dedup_memories,
     format_memories_as_markdown,
     format_memories_as_json,
     Priority,
     SortOrder
 )
+import shared_memory_mcp
 
 
 class TestWordCount:
@@ -255,6 +257,100 @@ class TestSearchMemories:
         assert len(results) == 3
 
 
+class TestDedupMemories:
+    """Test memory deduplication functionality."""
+
+    @pytest.fixture
+    def sample_memories(self):
+        return [
+            {"entry_id": "1", "content": "shared note", "priority": "low",
+             "timestamp": "2025-01-01"},
+            {"entry_id": "2", "content": "unique note", "priority": "medium",
+             "timestamp": "2025-01-02"},
+            {"entry_id": "3", "content": "shared note", "priority": "high",
+             "timestamp": "2025-01-03"}
+        ]
+
+    def test_dedup_keeps_highest_priority(self, sample_memories):
+        result = dedup_memories(sample_memories)
+        assert [m["entry_id"] for m in result] == ["2", "3"]
+
+    def test_dedup_ties_keep_newest(self):
+        memories = [
+            {"entry_id": "1", "content": "note", "priority": "medium",
+             "timestamp": "2025-01-01"},
+            {"entry_id": "2", "content": "note", "priority": "medium",
+             "timestamp": "2025-01-02"}
+        ]
+        result = dedup_memories(memories)
+        assert [m["entry_id"] for m in result] == ["2"]
+
+    def test_dedup_no_duplicates(self, sample_memories):
+        unique = sample_memories[:2]
+        assert dedup_memories(unique) == unique
+
+    def test_dedup_empty_list(self):
+        assert dedup_memories([]) == []
+
+
+class TestReplayAppendLog:
+    """Test replaying the NDJSON append log onto snapshot entries."""
+
+    @pytest.fixture
+    def log_file(self):
+        """Point the module's append log at a temp file for the test."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original = shared_memory_mcp.APPEND_LOG_FILE
+            shared_memory_mcp.APPEND_LOG_FILE = Path(temp_dir) / "memory.ndjson"
+            try:
+                yield shared_memory_mcp.APPEND_LOG_FILE
+            finally:
+                shared_memory_mcp.APPEND_LOG_FILE = original
+
+    def _write_log(self, log_file, records):
+        with open(log_file, 'w') as f:
+            for record in records:
+                line = record if isinstance(record, str) else json.dumps(record)
+                f.write(line + '\n')
+
+    def test_replay_add_update_delete(self, log_file):
+        entries = [{"entry_id": "snap-1", "content": "original"}]
+        self._write_log(log_file, [
+            {"entry_id": "log-1", "content": "added"},
+            {"op": "update", "entry_id": "snap-1",
+             "fields": {"content": "updated"}},
+            {"op": "delete", "entry_id": "log-1"}
+        ])
+        shared_memory_mcp._replay_append_log(entries)
+        assert [e["entry_id"] for e in entries] == ["snap-1"]
+        assert entries[0]["content"] == "updated"
+
+    def test_replay_skips_corrupt_line(self, log_file):
+        entries = []
+        self._write_log(log_file, [
+            '{not valid json',
+            {"entry_id": "log-1", "content": "after corrupt line"}
+        ])
+        shared_memory_mcp._replay_append_log(entries)
+        assert [e["entry_id"] for e in entries] == ["log-1"]
+
+    def test_replay_skips_add_already_in_snapshot(self, log_file):
+        # A crash between the snapshot write and the log reset leaves the
+        # add in both files; the snapshot copy must win and load once
+        entries = [{"entry_id": "dup-1", "content": "snapshot copy"}]
+        self._write_log(log_file, [
+            {"entry_id": "dup-1", "content": "log copy"}
+        ])
+        shared_memory_mcp._replay_append_log(entries)
+        assert len(entries) == 1
+        assert entries[0]["content"] == "snapshot copy"
+
+    def test_replay_missing_log(self, log_file):
+        entries = [{"entry_id": "snap-1", "content": "original"}]
+        shared_memory_mcp._replay_append_log(entries)
+        assert len(entries) == 1
+
+
 class TestFormatting:
     """Test memory formatting functions."""
 
@@ -12,10 +12,13 @@ Supports:
 - Context manager for safe lock acquisition/release
 """
 
+import os
+import random
+import tempfile
 import time
 import platform
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from contextlib import contextmanager
 
 # Platform-specific imports
@@ -27,6 +30,23 @@ else:
     import fcntl
 
 
+# fdatasync skips the inode-metadata journal flush where the platform
+# supports it (Linux); size changes are still captured because the data
+# write extends the file
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def _try_lock(file_handle, shared: bool) -> None:
+    """Attempt one non-blocking lock; raises OSError if already held."""
+    if _IS_WINDOWS:
+        # Windows: Lock first byte of file
+        msvcrt.locking(file_handle.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        # Unix: Non-blocking lock, shared for readers
+        lock_type = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        fcntl.flock(file_handle.fileno(), lock_type | fcntl.LOCK_NB)
+
+
 class FileLockError(Exception):
     """Raised when file locking operations fail."""
     pass
@@ -42,10 +62,11 @@ def file_lock(
     file_path: Path,
     timeout: float = 10.0,
     retry_delay: float = 0.1,
-    max_retry_delay: float = 2.0
+    max_retry_delay: float = 2.0,
+    shared: bool = False
 ):
     """
-    Context manager for acquiring an exclusive lock on a file.
+    Context manager for acquiring a lock on a file.
 
     Uses platform-specific locking mechanisms:
     - Unix/Linux/Mac: fcntl.flock()
@@ -58,6 +79,9 @@ def file_lock(
         timeout (float): Maximum time to wait for lock in seconds (default: 10.0)
         retry_delay (float): Initial delay between retries in seconds (default: 0.1)
         max_retry_delay (float): Maximum delay between retries in seconds (default: 2.0)
+        shared (bool): Acquire a shared (read) lock instead of an exclusive
+            one, letting concurrent readers proceed in parallel. Unix only;
+            Windows locks are always exclusive (msvcrt has no shared mode)
 
     Yields:
         file: Open file handle with exclusive lock acquired
@@ -75,44 +99,44 @@ def file_lock(
         ...     json.dump(data, f)
     """
     file_handle = None
-    start_time = time.time()
-    current_retry_delay = retry_delay
 
     try:
-        # Ensure file exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        if not file_path.exists():
-            file_path.touch()
-
-        # Open file for reading and writing
-        file_handle = open(file_path, 'r+')
-
-        # Try to acquire lock with exponential backoff
-        while True:
-            try:
-                if _IS_WINDOWS:
-                    # Windows: Lock first byte of file
-                    msvcrt.locking(file_handle.fileno(), msvcrt.LK_NBLCK, 1)
-                else:
-                    # Unix: Use exclusive non-blocking lock
-                    fcntl.flock(file_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-
-                # Lock acquired successfully
-                break
 
-            except (IOError, OSError) as e:
-                # Lock is held by another process
-                elapsed = time.time() - start_time
-
-                if elapsed >= timeout:
-                    raise FileLockTimeout(
-                        f"Could not acquire lock on {file_path} within {timeout}s. "
-                        f"Another process may be using the file."
-                    ) from e
-
-                # Wait with exponential backoff
-                time.sleep(current_retry_delay)
-                current_retry_delay = min(current_retry_delay * 2, max_retry_delay)
+        # One open with O_CREAT replaces the exists/touch/open sequence
+        # (three syscalls and a race window between them)
+        fd = os.open(str(file_path), os.O_RDWR | os.O_CREAT, 0o644)
+        file_handle = os.fdopen(fd, 'r+')
+
+        try:
+            # Fast path: the common uncontended acquire succeeds here
+            # with no clock reads or backoff bookkeeping
+            _try_lock(file_handle, shared)
+        except (IOError, OSError):
+            # Contended: retry with timeout and exponential backoff
+            start_time = time.monotonic()
+            current_retry_delay = retry_delay
+
+            while True:
+                try:
+                    _try_lock(file_handle, shared)
+                    break
+
+                except (IOError, OSError) as e:
+                    # Lock is held by another process
+                    elapsed = time.monotonic() - start_time
+
+                    if elapsed >= timeout:
+                        raise FileLockTimeout(
+                            f"Could not acquire lock on {file_path} within {timeout}s. "
+                            f"Another process may be using the file."
+                        ) from e
+
+                    # Wait with jittered exponential backoff; the jitter
+                    # de-synchronizes contenders that started retrying at the
+                    # same moment, so they don't keep colliding in lockstep
+                    time.sleep(current_retry_delay * random.uniform(0.5, 1.5))
+                    current_retry_delay = min(current_retry_delay * 2, max_retry_delay)
 
         # Yield the locked file handle
         yield file_handle
@@ -139,20 +163,41 @@ def file_lock(
                 file_handle.close()
 
 
-def atomic_write(file_path: Path, content: str) -> None:
+def _fsync_dir(dir_path: Path) -> None:
+    """Flush a directory entry so a completed rename survives a crash."""
+    try:
+        dir_fd = os.open(str(dir_path), os.O_RDONLY)
+    except OSError:
+        # Windows cannot open directories; skip the extra durability step
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def atomic_write(file_path: Path, content: Union[str, bytes], durable: bool = True) -> None:
     """
     Atomically write content to a file using temp file + rename pattern.
 
     This prevents partial writes and corruption if the process is interrupted.
 
     Process:
-    1. Write to temporary file in same directory
-    2. Flush and fsync to ensure data is written to disk
-    3. Atomically rename temp file to target file
+    1. Write to a uniquely-named temp file in the same directory
+       (mkstemp, so concurrent writers never share a temp path)
+    2. fdatasync the data to disk
+    3. Atomically rename the temp file over the target
+    4. fsync the directory so the rename itself is durable
 
     Args:
         file_path (Path): Target file path
-        content (str): Content to write
+        content (Union[str, bytes]): Content to write; str is encoded as
+            UTF-8, bytes are written as-is (no encode pass)
+        durable (bool): Sync data (and the directory entry) to disk
+            (default True). Pass False for writes whose loss on power
+            failure is acceptable; the rename is still atomic either way
 
     Raises:
         OSError: If write or rename operations fail
@@ -163,29 +208,36 @@ def atomic_write(file_path: Path, content: str) -> None:
     # Ensure parent directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create temp file in same directory (ensures same filesystem for atomic rename)
-    temp_path = file_path.parent / f".{file_path.name}.tmp"
+    if isinstance(content, str):
+        content = content.encode('utf-8')
 
+    # mkstemp creates and opens the temp file in one call on the same
+    # filesystem as the target (required for an atomic rename); raw
+    # os.write of the whole buffer skips buffered-IO copies
+    fd, temp_name = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
     try:
-        # Write to temp file
-        with open(temp_path, 'w') as f:
-            f.write(content)
-            f.flush()
-            # Ensure data is written to disk
-            import os
-            os.fsync(f.fileno())
-
-        # Atomically rename temp file to target
-        # On Unix: atomic operation
-        # On Windows: not atomic, but close enough for our use case
-        temp_path.replace(file_path)
+        try:
+            os.write(fd, content)
+            if durable:
+                _fdatasync(fd)
+        finally:
+            os.close(fd)
+
+        os.replace(temp_name, file_path)
 
     except Exception:
         # Clean up temp file on error
-        if temp_path.exists():
-            temp_path.unlink()
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
         raise
 
+    if durable:
+        _fsync_dir(file_path.parent)
+
 
 # Convenience function for locked read operations
 @contextmanager
@@ -204,7 +256,7 @@ def locked_read(file_path: Path, timeout: float = 10.0):
         >>> with locked_read(Path("data.json")) as content:
         ...     data = json.loads(content)
     """
-    with file_lock(file_path, timeout=timeout) as f:
+    with file_lock(file_path, timeout=timeout, shared=True) as f:
         content = f.read()
         yield content
 
@@ -226,7 +278,7 @@ def locked_write(file_path: Path, timeout: float = 10.0):
         >>> with locked_write(Path("data.json")) as write:
         ...     write(json.dumps(data, indent=2))
     """
-    def write_fn(content: str):
+    def write_fn(content: Union[str, bytes]):
         atomic_write(file_path, content)
 
     with file_lock(file_path, timeout=timeout):
@@ -20,8 +20,10 @@ Log format includes:
 - Additional context (agent_name, entry_id, etc.)
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 from typing import Optional, Dict, Any
 import json
@@ -34,6 +36,11 @@ LOG_FILE = Path.home() / ".shared_memory_mcp" / "mcp_memory.log"
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Background listener thread that owns the file handler (started once by
+# setup_logger); kept at module level so it survives and can be stopped
+# at interpreter exit
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logger(
     name: str = "shared_memory_mcp",
@@ -82,14 +89,23 @@ def setup_logger(
         backupCount=backup_count,
         encoding='utf-8'
     )
-    file_handler.setLevel(level)
 
     # Create formatter
     formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
     file_handler.setFormatter(formatter)
 
-    # Add handler to logger
-    logger.addHandler(file_handler)
+    # Hot paths log through an in-memory queue; a background listener
+    # thread owns the file handler, so tool calls never block on disk
+    # writes or rotation. Level filtering happens at the queue handler
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+
+    global _log_listener
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
     return logger
 
@@ -118,21 +134,29 @@ class StructuredLogger:
             return f"{message}{context_str}"
         return message
 
+    # Each level checks isEnabledFor before formatting, so filtered-out
+    # calls (e.g. DEBUG under the default INFO config) skip the context
+    # string building entirely
+
     def debug(self, message: str, **context):
         """Log debug message with context."""
-        self.logger.debug(self._format_message(message, context))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message(message, context))
 
     def info(self, message: str, **context):
         """Log info message with context."""
-        self.logger.info(self._format_message(message, context))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message(message, context))
 
     def warning(self, message: str, **context):
         """Log warning message with context."""
-        self.logger.warning(self._format_message(message, context))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_message(message, context))
 
     def error(self, message: str, exc_info: bool = False, **context):
         """Log error message with context and optional exception info."""
-        self.logger.error(self._format_message(message, context), exc_info=exc_info)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_message(message, context), exc_info=exc_info)
 
     # Operation-specific logging methods
 
@@ -145,6 +169,9 @@ class StructuredLogger:
         error: Optional[str] = None
     ):
         """Log memory addition operation."""
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
+
         context = {
             "operation": "add_memory",
             "agent": agent_name,
@@ -167,6 +194,9 @@ class StructuredLogger:
         truncated: bool = False
     ):
         """Log memory read operation."""
+        if not self.logger.isEnabledFor(logging.WARNING if truncated else logging.INFO):
+            return
+
         context = {
             "operation": "read_memory",
             "format": format,
@@ -187,6 +217,9 @@ class StructuredLogger:
 
     def log_clear_memory(self, entries_cleared: int, success: bool = True):
         """Log memory clear operation."""
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
+
         context = {
             "operation": "clear_memory",
             "entries_cleared": entries_cleared
@@ -205,6 +238,9 @@ class StructuredLogger:
         error: Optional[str] = None
     ):
         """Log memory update operation."""
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
+
         context = {
             "operation": "update_memory",
             "entry_id": entry_id,
@@ -224,6 +260,9 @@ class StructuredLogger:
         error: Optional[str] = None
     ):
         """Log memory delete operation."""
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
+
         context = {
             "operation": "delete_memory",
             "entry_id": entry_id
@@ -242,6 +281,9 @@ class StructuredLogger:
         search_time_ms: Optional[float] = None
     ):
         """Log memory search operation."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         context = {
             "operation": "search_memory",
             "query": query[:50],  # Truncate long queries
@@ -255,6 +297,9 @@ class StructuredLogger:
 
     def log_lock_acquired(self, file_path: str, wait_time_ms: float):
         """Log successful file lock acquisition."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
         context = {
             "operation": "file_lock",
             "file": file_path,
@@ -264,6 +309,9 @@ class StructuredLogger:
 
     def log_lock_timeout(self, file_path: str, timeout_s: float):
         """Log file lock timeout."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         context = {
             "operation": "file_lock",
             "file": file_path,
@@ -273,6 +321,9 @@ class StructuredLogger:
 
     def log_storage_corruption(self, file_path: str, error: str):
         """Log storage corruption detected."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         context = {
             "operation": "storage",
             "file": file_path,
@@ -282,6 +333,9 @@ class StructuredLogger:
 
     def log_storage_recovered(self, file_path: str, backup_used: bool = False):
         """Log storage recovery."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         context = {
             "operation": "storage",
             "file": file_path,